@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from .models import Project, AnalysisRun, Artifact, Document, Section
+from services.prompting import TagMatch
 
 
 class AnalyzeRequestSerializer(serializers.Serializer):
@@ -164,3 +165,4 @@ class SectionSpecSerializer(serializers.Serializer):
     style_profile = serializers.CharField()
     target_chars = serializers.ListField(child=serializers.IntegerField())
     constraints = serializers.ListField(child=serializers.CharField())
+    tag_match = serializers.ChoiceField(choices=[mode.value for mode in TagMatch])
@@ -26,7 +26,7 @@ from .serializers import (
 )
 from services.analyzer.constants import ANALYZER_VERSION
 from services.documents import DocumentService, SectionBusy
-from services.prompting import get_section_spec, list_section_keys
+from services.prompting import TagMatch, get_section_spec, list_section_keys
 from tasks.analyzer_tasks import run_analysis
 
 
@@ -488,7 +488,8 @@ def sections_registry(request):
             'needs_summaries': spec.needs_summaries,
             'style_profile': spec.style_profile,
             'target_chars': spec.target_chars,
-            'constraints': spec.constraints
+            'constraints': spec.constraints,
+            'tag_match': TagMatch(spec.tag_match).value
         })
 
     return Response(SectionSpecSerializer(specs, many=True).data)
@@ -1,4 +1,3 @@
-from .analyzer import RepoAnalyzer
 from .models import (
     Evidence,
     Language,
@@ -23,3 +22,10 @@ __all__ = [
     "FrontendRoute",
     "Dependency",
 ]
+
+
+def __getattr__(name):
+    if name == "RepoAnalyzer":
+        from .analyzer import RepoAnalyzer
+        return RepoAnalyzer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
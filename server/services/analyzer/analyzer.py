@@ -3,8 +3,10 @@ import tempfile
 from pathlib import Path
 from typing import Any
 
-from .git import clone_repository
+from .git import clone_repository, list_head_files
 from .facts import generate_facts_json
+from .index import RepoIndex
+from .utils import utc_timestamp
 
 
 class RepoAnalyzer:
@@ -13,15 +15,25 @@ class RepoAnalyzer:
         self.work_dir = work_dir or tempfile.mkdtemp()
         self.repo_path: Path | None = None
         self.commit_sha: str | None = None
+        self.detected_at: str | None = None
+        self._facts: dict[str, Any] | None = None
 
     def clone(self) -> Path:
         self.repo_path, self.commit_sha = clone_repository(self.repo_url, self.work_dir)
+        self.detected_at = utc_timestamp()
+        self._facts = None
         return self.repo_path
 
     def generate_facts(self) -> dict[str, Any]:
         if not self.repo_path or not self.commit_sha:
             raise RuntimeError("Repository not cloned. Call clone() first.")
-        return generate_facts_json(self.repo_path, self.repo_url, self.commit_sha)
+        if self._facts is None:
+            paths = list_head_files(self.repo_path)
+            index = RepoIndex.from_paths(self.repo_path, paths) if paths is not None else None
+            self._facts = generate_facts_json(
+                self.repo_path, self.repo_url, self.commit_sha, detected_at=self.detected_at, index=index
+            )
+        return self._facts
 
     def analyze(self) -> dict[str, Any]:
         self.clone()
@@ -32,5 +44,4 @@ class RepoAnalyzer:
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(facts, f, ensure_ascii=False, indent=2)
+        output_path.write_text(json.dumps(facts, ensure_ascii=False, indent=2), encoding="utf-8")
@@ -1,11 +1,14 @@
 ANALYZER_VERSION = "v1"
 FACTS_SCHEMA = "facts.v1"
 
-SKIP_DIRS = {
+SKIP_DIRS = frozenset({
     "node_modules", "vendor", ".git", "__pycache__", "venv", ".venv",
     "env", "dist", "build", "eggs", ".eggs", ".tox", "htmlcov",
     ".next", ".nuxt", "coverage", ".cache", ".pytest_cache", ".mypy_cache"
-}
+})
+
+MAX_SOURCE_CHARS = 1_048_576
+EXTRACTOR_SUFFIXES = (".py", ".js", ".ts", ".tsx", ".jsx", ".vue")
 
 EXTENSION_TO_LANG = {
     ".py": "Python",
@@ -27,6 +30,11 @@ EXTENSION_TO_LANG = {
     ".svelte": "Svelte",
 }
 
+LANG_TO_EXTENSIONS = {
+    lang: [ext for ext, ext_lang in EXTENSION_TO_LANG.items() if ext_lang == lang]
+    for lang in dict.fromkeys(EXTENSION_TO_LANG.values())
+}
+
 PYTHON_FRAMEWORKS = {
     "django": ("Django", "web"),
     "fastapi": ("FastAPI", "web"),
@@ -1,39 +1,47 @@
-import os
+import re
+from collections import Counter
 from pathlib import Path
 from typing import Any
 
 from .constants import (
-    EXTENSION_TO_LANG, PYTHON_FRAMEWORKS, JS_FRAMEWORKS, SKIP_DIRS, DEEP_ROLE_MAPPING
+    EXTENSION_TO_LANG, EXTRACTOR_SUFFIXES, LANG_TO_EXTENSIONS, PYTHON_FRAMEWORKS, JS_FRAMEWORKS, DEEP_ROLE_MAPPING
 )
+from .index import RepoIndex
 from .models import Language, Framework, Dependency, Evidence
-from .parsers import parse_requirements_txt, parse_package_json
-from .utils import rel_path, find_files_recursive, count_lines
+from .parsers import parse_requirements_txt, parse_package_json, parse_pyproject_toml
+from .utils import rel_path, file_ext, count_code_lines, read_text
 
+_BACKEND_FRAMEWORKS = frozenset({"fastapi", "flask", "django", "express", "nestjs"})
+_FRONTEND_FRAMEWORKS = frozenset({"react", "vue.js", "angular", "svelte"})
+_WEB_FRAMEWORK_DEPS = frozenset({"fastapi", "django", "flask"})
+_JS_FRAMEWORK_RE = re.compile("|".join(map(re.escape, JS_FRAMEWORKS)))
 
-def detect_languages(repo_path: Path) -> list[Language]:
+
+def detect_languages(repo_path: Path, index: RepoIndex | None = None) -> list[Language]:
     if not repo_path:
         raise RuntimeError("Repository not cloned")
 
-    lang_loc: dict[str, int] = {}
+    if index is None:
+        index = RepoIndex.build(repo_path)
+
+    lang_loc: Counter[str] = Counter()
 
-    for root, dirs, files in os.walk(repo_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-        for file in files:
-            ext = Path(file).suffix.lower()
-            if ext in EXTENSION_TO_LANG:
-                lang = EXTENSION_TO_LANG[ext]
-                file_path = Path(root) / file
-                loc = count_lines(file_path)
-                lang_loc[lang] = lang_loc.get(lang, 0) + loc
+    for path, name in index.files:
+        lang = EXTENSION_TO_LANG.get(file_ext(name))
+        if lang is not None:
+            content = read_text(path)
+            if content is not None and name.endswith(EXTRACTOR_SUFFIXES):
+                index.remember(path, content)
+            lang_loc[lang] += count_code_lines(content or "")
 
-    total = sum(lang_loc.values())
+    total = lang_loc.total()
     if total == 0:
         return []
 
     languages = []
-    for lang, loc in sorted(lang_loc.items(), key=lambda x: -x[1]):
+    for lang, loc in lang_loc.most_common():
         ratio = round(loc / total, 2)
-        extensions = [ext for ext, l in EXTENSION_TO_LANG.items() if l == lang]
+        extensions = LANG_TO_EXTENSIONS[lang]
         languages.append(Language(
             name=lang,
             ratio=ratio,
@@ -44,14 +52,17 @@ def detect_languages(repo_path: Path) -> list[Language]:
     return languages
 
 
-def detect_frameworks(repo_path: Path) -> list[Framework]:
+def detect_frameworks(repo_path: Path, index: RepoIndex | None = None) -> list[Framework]:
     if not repo_path:
         raise RuntimeError("Repository not cloned")
 
+    if index is None:
+        index = RepoIndex.build(repo_path)
+
     frameworks = []
     found_frameworks = set()
 
-    for req_path in find_files_recursive(repo_path, "requirements.txt"):
+    for req_path in index.find("requirements.txt"):
         rel_path_str = rel_path(req_path, repo_path)
         deps = parse_requirements_txt(req_path, rel_path_str)
         for dep in deps:
@@ -64,11 +75,16 @@ def detect_frameworks(repo_path: Path) -> list[Framework]:
                 ))
                 found_frameworks.add(dep.name)
 
-    for pyproject_path in find_files_recursive(repo_path, "pyproject.toml"):
-        content = pyproject_path.read_text(encoding="utf-8", errors="ignore").lower()
+    for pyproject_path in index.find("pyproject.toml"):
         rel_path_str = rel_path(pyproject_path, repo_path)
+        deps, pyproject_data = parse_pyproject_toml(pyproject_path, rel_path_str)
+        if pyproject_data:
+            dep_names = {dep.name for dep in deps}
+        else:
+            content = pyproject_path.read_text(encoding="utf-8", errors="ignore").lower()
+            dep_names = {key for key in PYTHON_FRAMEWORKS if key in content}
         for key, (name, fw_type) in PYTHON_FRAMEWORKS.items():
-            if key in content and key not in found_frameworks:
+            if key in dep_names and key not in found_frameworks:
                 frameworks.append(Framework(
                     name=name,
                     type=fw_type,
@@ -76,10 +92,12 @@ def detect_frameworks(repo_path: Path) -> list[Framework]:
                 ))
                 found_frameworks.add(key)
 
-    for package_path in find_files_recursive(repo_path, "package.json"):
+    for package_path in index.find("package.json"):
         rel_path_str = rel_path(package_path, repo_path)
         deps, _ = parse_package_json(package_path, rel_path_str)
         for dep in deps:
+            if not _JS_FRAMEWORK_RE.search(dep.name):
+                continue
             for key, (name, fw_type) in JS_FRAMEWORKS.items():
                 if key in dep.name and key not in found_frameworks:
                     frameworks.append(Framework(
@@ -92,21 +110,24 @@ def detect_frameworks(repo_path: Path) -> list[Framework]:
     return frameworks
 
 
-def detect_dependencies(repo_path: Path) -> list[Dependency]:
+def detect_dependencies(repo_path: Path, index: RepoIndex | None = None) -> list[Dependency]:
     if not repo_path:
         raise RuntimeError("Repository not cloned")
 
+    if index is None:
+        index = RepoIndex.build(repo_path)
+
     all_deps = []
     seen = set()
 
-    for req_path in find_files_recursive(repo_path, "requirements.txt"):
+    for req_path in index.find("requirements.txt"):
         rel_path_str = rel_path(req_path, repo_path)
         for dep in parse_requirements_txt(req_path, rel_path_str):
             if dep.name not in seen:
                 all_deps.append(dep)
                 seen.add(dep.name)
 
-    for package_path in find_files_recursive(repo_path, "package.json"):
+    for package_path in index.find("package.json"):
         rel_path_str = rel_path(package_path, repo_path)
         deps, _ = parse_package_json(package_path, rel_path_str)
         for dep in deps:
@@ -117,12 +138,20 @@ def detect_dependencies(repo_path: Path) -> list[Dependency]:
     return all_deps
 
 
-def detect_architecture_type(repo_path: Path) -> dict[str, Any]:
+def detect_architecture_type(
+    repo_path: Path,
+    index: RepoIndex | None = None,
+    frameworks: list[Framework] | None = None,
+    dependencies: list[Dependency] | None = None
+) -> dict[str, Any]:
     if not repo_path:
         raise RuntimeError("Repository not cloned")
 
+    if index is None:
+        index = RepoIndex.build(repo_path)
+
     arch_type = "unknown"
-    layers = []
+    layers: dict[str, None] = {}
     evidence = []
     details = {}
 
@@ -132,17 +161,16 @@ def detect_architecture_type(repo_path: Path) -> dict[str, Any]:
     frontend_indicators = {"frontend", "client", "web", "ui"}
     backend_indicators = {"backend", "server", "api"}
 
-    for item in repo_path.iterdir():
-        if item.is_dir():
-            name_lower = item.name.lower()
-            if name_lower in frontend_indicators:
-                has_frontend = True
-                layers.append("frontend")
-                evidence.append(Evidence(path=item.name))
-            if name_lower in backend_indicators:
-                has_backend = True
-                layers.append("backend")
-                evidence.append(Evidence(path=item.name))
+    for name in index.top_level_dirs:
+        name_lower = name.lower()
+        if name_lower in frontend_indicators:
+            has_frontend = True
+            layers["frontend"] = None
+            evidence.append(Evidence(path=name))
+        if name_lower in backend_indicators:
+            has_backend = True
+            layers["backend"] = None
+            evidence.append(Evidence(path=name))
 
     if has_frontend and has_backend:
         arch_type = "client-server"
@@ -152,27 +180,27 @@ def detect_architecture_type(repo_path: Path) -> dict[str, Any]:
     elif has_backend:
         arch_type = "api"
 
-    frameworks = detect_frameworks(repo_path)
+    if frameworks is None:
+        frameworks = detect_frameworks(repo_path, index)
     fw_names = {fw.name.lower() for fw in frameworks}
 
     if "next.js" in fw_names or "nuxt.js" in fw_names:
         arch_type = "fullstack-ssr"
 
-    if any(name in fw_names for name in ["fastapi", "flask", "django", "express", "nestjs"]):
+    if not fw_names.isdisjoint(_BACKEND_FRAMEWORKS):
         details["api_type"] = "REST"
-        if "backend" not in layers:
-            layers.append("backend")
+        layers["backend"] = None
         if arch_type == "unknown":
             arch_type = "api"
 
-    if any(name in fw_names for name in ["react", "vue.js", "angular", "svelte"]):
-        if "frontend" not in layers:
-            layers.append("frontend")
+    if not fw_names.isdisjoint(_FRONTEND_FRAMEWORKS):
+        layers["frontend"] = None
         if arch_type == "unknown":
             arch_type = "spa"
 
-    deps = detect_dependencies(repo_path)
-    dep_dict = {d.name: d for d in deps}
+    if dependencies is None:
+        dependencies = detect_dependencies(repo_path, index)
+    dep_dict = {d.name: d for d in dependencies}
     dep_names = set(dep_dict.keys())
 
     db_frameworks = []
@@ -190,8 +218,7 @@ def detect_architecture_type(repo_path: Path) -> dict[str, Any]:
             if fw.name.lower() in db_frameworks:
                 db_evidence.append(fw.evidence[0].path if fw.evidence else fw.name)
         details["database"] = {"type": db_type, "orm": db_frameworks[0].title(), "evidence": db_evidence}
-        if "data" not in layers:
-            layers.append("data")
+        layers["data"] = None
 
     jwt_deps = ["python-jose", "pyjwt", "jsonwebtoken"]
     for jwt_dep in jwt_deps:
@@ -218,25 +245,31 @@ def detect_architecture_type(repo_path: Path) -> dict[str, Any]:
             break
 
     if arch_type == "unknown":
-        for pyproject in find_files_recursive(repo_path, "pyproject.toml"):
-            content = pyproject.read_text(encoding="utf-8", errors="ignore")
-            if "[project]" in content or "[tool.poetry]" in content:
-                if "fastapi" not in content.lower() and "django" not in content.lower() and "flask" not in content.lower():
-                    arch_type = "library"
-                    break
-
-    for dockerfile in find_files_recursive(repo_path, "Dockerfile"):
-        if "infra" not in layers:
-            layers.append("infra")
+        for pyproject in index.find("pyproject.toml"):
+            pyproject_deps, pyproject_data = parse_pyproject_toml(pyproject, rel_path(pyproject, repo_path))
+            if pyproject_data:
+                is_package = "project" in pyproject_data or "poetry" in pyproject_data.get("tool", {})
+                web_deps = {dep.name for dep in pyproject_deps}
+            else:
+                content = pyproject.read_text(encoding="utf-8", errors="ignore")
+                is_package = "[project]" in content or "[tool.poetry]" in content
+                content_lower = content.lower()
+                web_deps = {name for name in _WEB_FRAMEWORK_DEPS if name in content_lower}
+            if is_package and web_deps.isdisjoint(_WEB_FRAMEWORK_DEPS):
+                arch_type = "library"
+                break
+
+    for dockerfile in index.find("Dockerfile"):
+        layers["infra"] = None
         evidence.append(Evidence(path=rel_path(dockerfile, repo_path)))
 
     for compose in ["docker-compose.yml", "docker-compose.yaml"]:
-        for found in find_files_recursive(repo_path, compose):
+        for found in index.find(compose):
             evidence.append(Evidence(path=rel_path(found, repo_path)))
 
     return {
         "type": arch_type if arch_type != "unknown" else "monolith",
-        "layers": list(set(layers)) if layers else ["unknown"],
+        "layers": list(layers) if layers else ["unknown"],
         "details": details,
         "evidence": [{"path": e.path, "lines": e.lines} for e in evidence]
     }
@@ -1,18 +1,20 @@
-from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from .constants import FACTS_SCHEMA
 from .detectors import detect_languages, detect_frameworks, detect_dependencies, detect_architecture_type
 from .extractors import extract_fastapi_routes, extract_orm_models, extract_frontend_routes, extract_deep_modules
-from .utils import find_files_recursive, rel_path
+from .index import RepoIndex
+from .utils import rel_path, utc_timestamp
 
 
-def find_build_files(repo_path: Path) -> list[str]:
+def find_build_files(repo_path: Path, index: RepoIndex | None = None) -> list[str]:
     if not repo_path:
         return []
 
-    build_files = []
+    if index is None:
+        index = RepoIndex.build(repo_path)
+
     candidates = [
         "Dockerfile", "docker-compose.yml", "docker-compose.yaml",
         "Makefile", "setup.py", "pyproject.toml", "setup.cfg",
@@ -20,53 +22,54 @@ def find_build_files(repo_path: Path) -> list[str]:
         "webpack.config.js", "next.config.js", "nuxt.config.js", "nuxt.config.ts"
     ]
 
-    for candidate in candidates:
-        found = find_files_recursive(repo_path, candidate)
-        for f in found:
-            rel_path_str = rel_path(f, repo_path)
-            if rel_path_str not in build_files:
-                build_files.append(rel_path_str)
-
-    return build_files
+    return list(dict.fromkeys(
+        rel_path(f, repo_path) for candidate in candidates for f in index.find(candidate)
+    ))
 
 
-def find_entrypoints(repo_path: Path) -> list[str]:
+def find_entrypoints(repo_path: Path, index: RepoIndex | None = None) -> list[str]:
     if not repo_path:
         return []
 
-    entrypoints = []
+    if index is None:
+        index = RepoIndex.build(repo_path)
+
     candidates = [
         "main.py", "app.py", "manage.py", "wsgi.py", "asgi.py",
         "index.js", "app.js", "server.js", "main.go", "main.rs",
         "index.ts", "main.ts"
     ]
 
-    for candidate in candidates:
-        found = find_files_recursive(repo_path, candidate)
-        for f in found:
-            rel_path_str = rel_path(f, repo_path)
-            if rel_path_str not in entrypoints:
-                entrypoints.append(rel_path_str)
+    return list(dict.fromkeys(
+        rel_path(f, repo_path) for candidate in candidates for f in index.find(candidate)
+    ))
 
-    return entrypoints
 
+def generate_facts_json(
+    repo_path: Path,
+    repo_url: str,
+    commit_sha: str,
+    detected_at: str | None = None,
+    index: RepoIndex | None = None
+) -> dict[str, Any]:
+    if index is None:
+        index = RepoIndex.build(repo_path)
 
-def generate_facts_json(repo_path: Path, repo_url: str, commit_sha: str) -> dict[str, Any]:
-    languages = detect_languages(repo_path)
-    frameworks = detect_frameworks(repo_path)
-    architecture = detect_architecture_type(repo_path)
-    modules = extract_deep_modules(repo_path)
-    endpoints = extract_fastapi_routes(repo_path)
-    frontend_routes = extract_frontend_routes(repo_path)
-    orm_models = extract_orm_models(repo_path)
-    dependencies = detect_dependencies(repo_path)
+    languages = detect_languages(repo_path, index)
+    frameworks = detect_frameworks(repo_path, index)
+    dependencies = detect_dependencies(repo_path, index)
+    architecture = detect_architecture_type(repo_path, index, frameworks, dependencies)
+    modules = extract_deep_modules(repo_path, index)
+    endpoints = extract_fastapi_routes(repo_path, index)
+    frontend_routes = extract_frontend_routes(repo_path, index)
+    orm_models = extract_orm_models(repo_path, index)
 
     return {
         "schema": FACTS_SCHEMA,
         "repo": {
             "url": repo_url,
             "commit": commit_sha,
-            "detected_at": datetime.utcnow().isoformat() + "Z"
+            "detected_at": detected_at or utc_timestamp()
         },
         "languages": [
             {
@@ -142,7 +145,7 @@ def generate_facts_json(repo_path: Path, repo_url: str, commit_sha: str) -> dict
                 }
                 for dep in dependencies
             ],
-            "build_files": find_build_files(repo_path),
-            "entrypoints": find_entrypoints(repo_path)
+            "build_files": find_build_files(repo_path, index),
+            "entrypoints": find_entrypoints(repo_path, index)
         }
     }
@@ -1,27 +1,64 @@
+import os
 import subprocess
 import tempfile
 from pathlib import Path
 
+from .constants import SKIP_DIRS
 
-def check_repo_accessible(repo_url: str) -> bool:
-    result = subprocess.run(
-        ["git", "ls-remote", repo_url],
-        capture_output=True,
-        text=True
-    )
-    return result.returncode == 0
+_SPARSE_PATTERNS = "".join(["/*\n", *(f"!{name}/\n" for name in sorted(SKIP_DIRS))])
 
 
-def clone_repository(repo_url: str, work_dir: str | None = None) -> tuple[Path, str]:
-    if not check_repo_accessible(repo_url):
-        raise RuntimeError(f"Repository not accessible: {repo_url}")
+def read_head_sha(repo_path: Path) -> str | None:
+    git_dir = repo_path / ".git"
+    try:
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+        if not head.startswith("ref: "):
+            return head or None
+
+        ref = head[len("ref: "):]
+        ref_path = git_dir / ref
+        if ref_path.is_file():
+            return ref_path.read_text(encoding="utf-8").strip() or None
+
+        for line in (git_dir / "packed-refs").read_text(encoding="utf-8").splitlines():
+            sha, _, name = line.partition(" ")
+            if name == ref:
+                return sha
+    except OSError:
+        pass
+    return None
+
+
+def list_head_files(repo_path: Path) -> list[str] | None:
+    try:
+        result = subprocess.run(
+            ["git", "ls-tree", "-r", "-z", "--full-tree", "HEAD"],
+            cwd=repo_path,
+            capture_output=True
+        )
+    except OSError:
+        return None
+    if result.returncode != 0:
+        return None
+
+    paths = []
+    for record in result.stdout.split(b"\0"):
+        meta, _, path = record.partition(b"\t")
+        if meta.startswith((b"100644 ", b"100755 ")):
+            paths.append(os.fsdecode(path))
+    return paths
 
+
+def clone_repository(repo_url: str, work_dir: str | None = None) -> tuple[Path, str]:
     work_dir = work_dir or tempfile.mkdtemp()
     repo_name = repo_url.rstrip("/").split("/")[-1].replace(".git", "")
     repo_path = Path(work_dir) / repo_name
 
     result = subprocess.run(
-        ["git", "clone", "--depth=1", repo_url, str(repo_path)],
+        [
+            "git", "clone", "--depth=1", "--single-branch", "--no-tags",
+            "--filter=blob:none", "--no-checkout", repo_url, str(repo_path)
+        ],
         capture_output=True,
         text=True
     )
@@ -29,11 +66,37 @@ def clone_repository(repo_url: str, work_dir: str | None = None) -> tuple[Path,
         raise RuntimeError(f"Clone failed: {result.stderr}")
 
     result = subprocess.run(
-        ["git", "rev-parse", "HEAD"],
+        ["git", "sparse-checkout", "set", "--no-cone", "--stdin"],
         cwd=repo_path,
+        input=_SPARSE_PATTERNS,
         capture_output=True,
         text=True
     )
-    commit_sha = result.stdout.strip()
+    if result.returncode != 0:
+        subprocess.run(
+            ["git", "config", "core.sparseCheckout", "false"],
+            cwd=repo_path,
+            capture_output=True,
+            text=True
+        )
+
+    result = subprocess.run(
+        ["git", "checkout"],
+        cwd=repo_path,
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Checkout failed: {result.stderr}")
+
+    commit_sha = read_head_sha(repo_path)
+    if commit_sha is None:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=repo_path,
+            capture_output=True,
+            text=True
+        )
+        commit_sha = result.stdout.strip()
 
     return repo_path, commit_sha
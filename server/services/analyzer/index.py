@@ -0,0 +1,99 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .constants import SKIP_DIRS
+from .utils import iter_files, read_source, source_text, split_entries
+
+
+def _list_subtree(path: str) -> list[tuple[str, str]]:
+    return [(entry.path, entry.name) for entry in iter_files(path)]
+
+
+@dataclass
+class RepoIndex:
+    repo_path: Path
+    files: list[tuple[str, str]] = field(default_factory=list)
+    by_name: dict[str, list[int]] = field(default_factory=dict)
+    top_level_dirs: list[str] = field(default_factory=list)
+    dirs: dict[str, list[str]] | None = None
+    _contents: dict[str, str | None] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    @classmethod
+    def build(cls, repo_path: Path, max_workers: int | None = None) -> "RepoIndex":
+        index = cls(repo_path=repo_path)
+        if not repo_path:
+            return index
+
+        try:
+            with os.scandir(repo_path) as it:
+                entries = list(it)
+        except OSError:
+            return index
+
+        root_files, subdirs = split_entries(entries)
+        index.top_level_dirs = [entry.name for entry in entries if entry.is_dir()]
+
+        if len(subdirs) > 1 and (os.cpu_count() or 1) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                subtrees = list(pool.map(_list_subtree, subdirs))
+        else:
+            subtrees = [_list_subtree(path) for path in subdirs]
+
+        index._add_files((entry.path, entry.name) for entry in root_files)
+        for subtree in subtrees:
+            index._add_files(subtree)
+
+        return index
+
+    @classmethod
+    def from_paths(cls, repo_path: Path, paths: list[str]) -> "RepoIndex":
+        index = cls(repo_path=repo_path)
+        root = os.fspath(repo_path)
+        dirs: dict[str, dict[str, None]] = {}
+        files = []
+        for path in paths:
+            parts = path.split("/")
+            parent = ""
+            for part in parts[:-1]:
+                dirs.setdefault(parent, {})[part] = None
+                parent = f"{parent}/{part}" if parent else part
+            if len(parts) > 1 and not SKIP_DIRS.isdisjoint(parts[:-1]):
+                continue
+            files.append((os.path.join(root, *parts), parts[-1]))
+
+        index.dirs = {parent: list(children) for parent, children in dirs.items()}
+        index.top_level_dirs = index.dirs.get("", [])
+        index._add_files(files)
+        return index
+
+    def _add_files(self, files) -> None:
+        for path, name in files:
+            self.by_name.setdefault(name, []).append(len(self.files))
+            self.files.append((path, name))
+
+    def subdirs(self, rel_dir: str) -> list[str]:
+        if self.dirs is not None:
+            return self.dirs.get(rel_dir, [])
+        try:
+            with os.scandir(os.path.join(self.repo_path, rel_dir)) as it:
+                return [entry.name for entry in it if entry.is_dir()]
+        except OSError:
+            return []
+
+    def find(self, *names: str) -> list[Path]:
+        positions = sorted(i for name in names for i in self.by_name.get(name, ()))
+        return [Path(self.files[i][0]) for i in positions]
+
+    def with_suffix(self, *suffixes: str) -> list[Path]:
+        return [Path(path) for path, name in self.files if name.endswith(suffixes)]
+
+    def read(self, path: str | Path) -> str | None:
+        key = os.fspath(path)
+        if key not in self._contents:
+            self._contents[key] = read_source(key)
+        return self._contents[key]
+
+    def remember(self, path: str | Path, content: str) -> None:
+        self._contents[os.fspath(path)] = source_text(content)
@@ -1,28 +1,33 @@
 import json
 import re
+import tomllib
 from pathlib import Path
 
 from .models import Dependency, Evidence
 
+# Boundaries mirror str.splitlines() and [ \t\x1f] is the str.strip() whitespace left within a line.
+_REQUIREMENT_LINE_RE = re.compile(
+    rb'(?:^|(?<=[\r\v\f\x1c-\x1e]))[ \t\x1f]*'
+    rb'([a-zA-Z0-9_][a-zA-Z0-9_-]*)[ \t\x1f]*'
+    rb'(\[[^\n\r\v\f\x1c-\x1e]+\])?[ \t\x1f]*'
+    rb'([<>=!~]+[^\n\r\v\f\x1c-\x1e]+)?',
+    re.MULTILINE
+)
+
+_PEP508_RE = re.compile(r'^\s*([A-Za-z0-9][A-Za-z0-9._-]*)\s*(\[[^\]]*\])?\s*([^;]*)')
+
 
 def parse_requirements_txt(path: Path, rel_path_str: str) -> list[Dependency]:
     deps = []
     try:
-        content = path.read_text(encoding="utf-8", errors="ignore")
-        for line in content.splitlines():
-            line = line.strip()
-            if not line or line.startswith("#") or line.startswith("-"):
-                continue
-
-            match = re.match(r'^([a-zA-Z0-9_-]+)\s*(\[.+\])?\s*([<>=!~]+.+)?', line)
-            if match:
-                name = match.group(1).lower()
-                version = match.group(3) or "*"
-                deps.append(Dependency(
-                    name=name,
-                    version=version.strip(),
-                    evidence=[Evidence(path=rel_path_str)]
-                ))
+        content = path.read_bytes()
+        for match in _REQUIREMENT_LINE_RE.finditer(content):
+            version = match.group(3) or b"*"
+            deps.append(Dependency(
+                name=match.group(1).lower().decode("ascii"),
+                version=version.decode("utf-8", errors="ignore").strip(),
+                evidence=[Evidence(path=rel_path_str)]
+            ))
     except Exception:
         pass
     return deps
@@ -32,8 +37,7 @@ def parse_package_json(path: Path, rel_path_str: str) -> tuple[list[Dependency],
     deps = []
     package_data = {}
     try:
-        content = path.read_text(encoding="utf-8")
-        package_data = json.loads(content)
+        package_data = json.loads(path.read_bytes())
 
         for dep_type in ["dependencies", "devDependencies"]:
             for name, version in package_data.get(dep_type, {}).items():
@@ -47,6 +51,61 @@ def parse_package_json(path: Path, rel_path_str: str) -> tuple[list[Dependency],
     return deps, package_data
 
 
+def _pep508_dependency(requirement: str, rel_path_str: str) -> Dependency | None:
+    match = _PEP508_RE.match(requirement)
+    if not match:
+        return None
+    return Dependency(
+        name=match.group(1).lower(),
+        version=match.group(3).strip() or "*",
+        evidence=[Evidence(path=rel_path_str)]
+    )
+
+
+def _poetry_dependencies(table: dict, rel_path_str: str) -> list[Dependency]:
+    deps = []
+    for name, spec in table.items():
+        if name.lower() == "python":
+            continue
+        version = spec.get("version", "*") if isinstance(spec, dict) else str(spec)
+        deps.append(Dependency(
+            name=name.lower(),
+            version=version,
+            evidence=[Evidence(path=rel_path_str)]
+        ))
+    return deps
+
+
+def parse_pyproject_toml(path: Path, rel_path_str: str) -> tuple[list[Dependency], dict]:
+    deps = []
+    pyproject_data = {}
+    try:
+        with open(path, "rb") as f:
+            pyproject_data = tomllib.load(f)
+
+        project = pyproject_data.get("project", {})
+        requirements = list(project.get("dependencies", []))
+        for group in project.get("optional-dependencies", {}).values():
+            requirements.extend(group)
+        for group in pyproject_data.get("dependency-groups", {}).values():
+            requirements.extend(group)
+
+        for requirement in requirements:
+            if isinstance(requirement, str):
+                dep = _pep508_dependency(requirement, rel_path_str)
+                if dep:
+                    deps.append(dep)
+
+        poetry = pyproject_data.get("tool", {}).get("poetry", {})
+        deps.extend(_poetry_dependencies(poetry.get("dependencies", {}), rel_path_str))
+        deps.extend(_poetry_dependencies(poetry.get("dev-dependencies", {}), rel_path_str))
+        for group in poetry.get("group", {}).values():
+            deps.extend(_poetry_dependencies(group.get("dependencies", {}), rel_path_str))
+    except Exception:
+        pass
+    return deps, pyproject_data
+
+
 def extract_column_type(type_str: str) -> str:
     depth = 0
     result = []
@@ -1,27 +1,69 @@
 import os
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import Iterator
 
-from .constants import SKIP_DIRS
+from .constants import MAX_SOURCE_CHARS, SKIP_DIRS
 
 
 def normalize_path(path: str) -> str:
     return path.replace("\\", "/")
 
 
+def utc_timestamp() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def file_ext(name: str) -> str:
+    dot = name.rfind(".")
+    if 0 < dot < len(name) - 1:
+        return name[dot:].lower()
+    return ""
+
+
 def rel_path(path: Path, repo_path: Path) -> str:
+    path_str = os.fspath(path)
+    root = os.fspath(repo_path).rstrip(os.sep) + os.sep
+    if path_str.startswith(root):
+        return normalize_path(path_str[len(root):])
     return normalize_path(str(path.relative_to(repo_path)))
 
 
-def find_files_recursive(repo_path: Path, filename: str) -> list[Path]:
+def split_entries(entries: list[os.DirEntry], skip_dirs: frozenset[str] | set[str] = SKIP_DIRS) -> tuple[list[os.DirEntry], list[str]]:
+    files = []
+    subdirs = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+
+        if not is_dir:
+            files.append(entry)
+        elif entry.name not in skip_dirs and not entry.is_symlink():
+            subdirs.append(entry.path)
+    return files, subdirs
+
+
+def iter_files(repo_path: Path, skip_dirs: frozenset[str] | set[str] = SKIP_DIRS) -> Iterator[os.DirEntry]:
     if not repo_path:
-        return []
+        return
 
-    found = []
-    for root, dirs, files in os.walk(repo_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-        if filename in files:
-            found.append(Path(root) / filename)
-    return found
+    scandir = os.scandir
+    stack = [os.fspath(repo_path)]
+    pop = stack.pop
+    push = stack.extend
+
+    while stack:
+        try:
+            with scandir(pop()) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        files, subdirs = split_entries(entries, skip_dirs)
+        yield from files
+        push(reversed(subdirs))
 
 
 def find_dirs_recursive(repo_path: Path, dirname: str) -> list[Path]:
@@ -36,10 +78,29 @@ def find_dirs_recursive(repo_path: Path, dirname: str) -> list[Path]:
     return found
 
 
-def count_lines(file_path: Path) -> int:
+def read_text(file_path: str | Path) -> str | None:
+    try:
+        with open(file_path, encoding="utf-8", errors="ignore") as f:
+            return f.read()
+    except Exception:
+        return None
+
+
+def source_text(content: str, limit: int = MAX_SOURCE_CHARS) -> str | None:
+    if "\0" in content[:2048]:
+        return None
+    return content[:limit]
+
+
+def read_source(file_path: str | Path, limit: int = MAX_SOURCE_CHARS) -> str | None:
     try:
-        content = file_path.read_text(encoding="utf-8", errors="ignore")
-        lines = [l for l in content.splitlines() if l.strip() and not l.strip().startswith(("#", "//", "/*", "*"))]
-        return len(lines)
+        with open(file_path, encoding="utf-8", errors="ignore") as f:
+            content = f.read(limit)
     except Exception:
-        return 0
+        return None
+    return source_text(content, limit)
+
+
+def count_code_lines(content: str) -> int:
+    lines = [l for l in content.splitlines() if l.strip() and not l.strip().startswith(("#", "//", "/*", "*"))]
+    return len(lines)
@@ -63,3 +63,7 @@ MOCK_SECTION_TEXT = """# {title}
 
 Более подробное содержание будет добавлено при реальной генерации.
 """
+
+MOCK_SUMMARY_TEXT = """- Первый ключевой пункт
+- Второй ключевой пункт
+- Третий ключевой пункт"""
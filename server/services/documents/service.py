@@ -16,7 +16,7 @@ from services.prompting import slice_for_section, make_summary_request, parse_su
 from .prompts import (
     OUTLINE_SYSTEM, OUTLINE_USER_TEMPLATE,
     SECTION_SYSTEM, SECTION_USER_TEMPLATE,
-    MOCK_OUTLINE, MOCK_SECTION_TEXT
+    MOCK_OUTLINE, MOCK_SECTION_TEXT, MOCK_SUMMARY_TEXT
 )
 
 
@@ -400,7 +400,7 @@ class DocumentService:
         summary_request = make_summary_request(section.text_current, section.key)
 
         if self.mock_mode:
-            summary_text = "- Первый ключевой пункт\n- Второй ключевой пункт\n- Третий ключевой пункт"
+            summary_text = MOCK_SUMMARY_TEXT
             meta = {"mock": True, "job_id": job_id}
         else:
             result = self.llm_client.generate_text(
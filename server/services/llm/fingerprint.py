@@ -12,9 +12,16 @@ def normalize_params(params: dict[str, Any] | None) -> dict[str, Any]:
 def schema_hash(schema: dict[str, Any] | None) -> str:
     if not schema:
         return ""
-    return hashlib.sha256(
-        json.dumps(schema, sort_keys=True).encode()
-    ).hexdigest()[:16]
+    return hashlib.blake2b(
+        json.dumps(schema, sort_keys=True).encode(),
+        digest_size=8
+    ).hexdigest()
+
+
+def _update_field(digest: Any, value: str) -> None:
+    data = value.encode()
+    digest.update(len(data).to_bytes(8, "big"))
+    digest.update(data)
 
 
 def make_fingerprint(
@@ -24,12 +31,10 @@ def make_fingerprint(
     params: dict[str, Any] | None = None,
     schema: dict[str, Any] | None = None
 ) -> str:
-    payload = {
-        "model": model,
-        "system": system,
-        "user": user,
-        "params": normalize_params(params),
-        "schema_hash": schema_hash(schema),
-    }
-    content = json.dumps(payload, sort_keys=True, ensure_ascii=False)
-    return hashlib.sha256(content.encode()).hexdigest()
+    digest = hashlib.sha256()
+    _update_field(digest, model)
+    _update_field(digest, system)
+    _update_field(digest, user)
+    _update_field(digest, json.dumps(normalize_params(params), sort_keys=True, ensure_ascii=False))
+    _update_field(digest, schema_hash(schema))
+    return digest.hexdigest()
@@ -6,10 +6,11 @@ from .schema import (
     ContextLayer,
     RenderedPrompt,
     DebugInfo,
-    OutlineMode
+    OutlineMode,
+    TagMatch
 )
 from .registry import get_section_spec, list_section_keys
-from .slicer import slice_for_section
+from .slicer import slice_for_section, slice_for_sections
 from .summarizer import make_summary_request, parse_summary_response
 from .tokens import (
     TokenBudgetEstimator,
@@ -27,9 +28,11 @@ __all__ = [
     "RenderedPrompt",
     "DebugInfo",
     "OutlineMode",
+    "TagMatch",
     "get_section_spec",
     "list_section_keys",
     "slice_for_section",
+    "slice_for_sections",
     "make_summary_request",
     "parse_summary_response",
     "TokenBudgetEstimator",
@@ -1,16 +1,44 @@
 import json
+from functools import lru_cache
 from typing import Any
 from .schema import SectionSpec, ContextLayer, RenderedPrompt, OutlineMode
 
 
+class OutlineIndex:
+    def __init__(self, outline: dict[str, Any]):
+        self.outline = outline
+        self.sections = outline.get("sections", []) if outline else []
+        self.title = outline.get("title", "") if outline else ""
+        self.positions: dict[str, int] = {}
+        for i, s in enumerate(self.sections or []):
+            self.positions.setdefault(s.get("key"), i)
+        self._full_json: str | None = None
+        self._excerpts: dict[tuple[OutlineMode, str], str] = {}
+
+    def full_json(self) -> str:
+        if self._full_json is None:
+            self._full_json = json.dumps(self.outline, ensure_ascii=False, indent=2)
+        return self._full_json
+
+    def excerpt(self, mode: OutlineMode, section_key: str) -> str:
+        cache_key = (mode, section_key)
+        if cache_key not in self._excerpts:
+            self._excerpts[cache_key] = _extract_outline_excerpt(self, mode, section_key)
+        return self._excerpts[cache_key]
+
+
 def assemble_context(
     spec: SectionSpec,
     selected_facts: list[dict[str, Any]],
     outline: dict[str, Any],
     summaries: list[dict[str, Any]],
-    global_context: str = ""
+    global_context: str = "",
+    outline_index: OutlineIndex | None = None
 ) -> ContextLayer:
-    outline_excerpt = _extract_outline_excerpt(outline, spec.outline_mode, spec.key)
+    if outline_index is None:
+        outline_index = OutlineIndex(outline)
+
+    outline_excerpt = outline_index.excerpt(spec.outline_mode, spec.key)
     facts_slice = _format_facts(selected_facts)
     summaries_text = _format_summaries(summaries)
     constraints_text = _format_constraints(spec)
@@ -31,17 +59,14 @@ def render_prompt(spec: SectionSpec, layers: ContextLayer) -> RenderedPrompt:
     return RenderedPrompt(system=system_prompt, user=user_prompt)
 
 
-def _build_system_prompt(spec: SectionSpec) -> str:
-    style_instructions = {
-        "academic": "Используй строго академический стиль изложения.",
-        "business": "Используй деловой стиль изложения."
-    }
-
-    style = style_instructions.get(spec.style_profile, style_instructions["academic"])
+STYLE_INSTRUCTIONS = {
+    "academic": "Используй строго академический стиль изложения.",
+    "business": "Используй деловой стиль изложения."
+}
 
-    return f"""Ты генератор академических текстов для документации программного проекта.
+_SYSTEM_PROMPT_INTRO = "Ты генератор академических текстов для документации программного проекта.\n\n"
 
-{style}
+_SYSTEM_PROMPT_RULES = """
 
 ВАЖНО:
 - НЕ повторяй информацию из предыдущих секций (summaries)
@@ -50,46 +75,65 @@ def _build_system_prompt(spec: SectionSpec) -> str:
 - Ссылайся только на факты из раздела FACTS
 """
 
+_LAYER_HEADERS = (
+    ("global_context", "# GLOBAL CONTEXT\n"),
+    ("outline_excerpt", "# OUTLINE\n"),
+    ("facts_slice", "# FACTS\n"),
+    ("summaries", "# PREVIOUS SECTIONS (не повторяй эту информацию)\n"),
+    ("constraints", "# CONSTRAINTS\n"),
+)
 
-def _build_user_prompt(spec: SectionSpec, layers: ContextLayer) -> str:
-    sections = []
+_LAYER_SEPARATOR = "\n\n"
 
-    if layers.global_context:
-        sections.append(f"# GLOBAL CONTEXT\n{layers.global_context}")
+_TASK_HEADER = "\n# TASK\nСгенерируй секцию '"
 
-    if layers.outline_excerpt:
-        sections.append(f"# OUTLINE\n{layers.outline_excerpt}")
+_TASK_FOOTER = "' документа."
 
-    if layers.facts_slice:
-        sections.append(f"# FACTS\n{layers.facts_slice}")
 
-    if layers.summaries:
-        sections.append(f"# PREVIOUS SECTIONS (не повторяй эту информацию)\n{layers.summaries}")
+def _build_system_prompt(spec: SectionSpec) -> str:
+    return _system_prompt_for_style(spec.style_profile)
 
-    if layers.constraints:
-        sections.append(f"# CONSTRAINTS\n{layers.constraints}")
 
-    sections.append(f"\n# TASK\nСгенерируй секцию '{spec.key}' документа.")
+@lru_cache(maxsize=None)
+def _system_prompt_for_style(style_profile: str) -> str:
+    style = STYLE_INSTRUCTIONS.get(style_profile, STYLE_INSTRUCTIONS["academic"])
 
-    return "\n\n".join(sections)
+    return "".join((_SYSTEM_PROMPT_INTRO, style, _SYSTEM_PROMPT_RULES))
+
+
+def _build_user_prompt(spec: SectionSpec, layers: ContextLayer) -> str:
+    parts = []
+
+    for field_name, header in _LAYER_HEADERS:
+        text = getattr(layers, field_name)
+        if text:
+            parts.append(header)
+            parts.append(text)
+            parts.append(_LAYER_SEPARATOR)
+
+    parts.append(_TASK_HEADER)
+    parts.append(spec.key)
+    parts.append(_TASK_FOOTER)
+
+    return "".join(parts)
 
 
 def _extract_outline_excerpt(
-    outline: dict[str, Any],
+    outline_index: OutlineIndex,
     mode: OutlineMode,
     section_key: str
 ) -> str:
-    if not outline:
+    if not outline_index.outline:
         return ""
 
     if mode == OutlineMode.FULL:
-        return json.dumps(outline, ensure_ascii=False, indent=2)
+        return outline_index.full_json()
 
-    sections = outline.get("sections", [])
+    sections = outline_index.sections
     if not sections:
         return ""
 
-    title = outline.get("title", "")
+    title = outline_index.title
 
     if mode == OutlineMode.STRUCTURE:
         lines = []
@@ -105,11 +149,7 @@ def _extract_outline_excerpt(
         return "\n".join(lines)
 
     if mode == OutlineMode.LOCAL:
-        current_idx = None
-        for i, s in enumerate(sections):
-            if s.get("key") == section_key:
-                current_idx = i
-                break
+        current_idx = outline_index.positions.get(section_key)
 
         if current_idx is None:
             return ""
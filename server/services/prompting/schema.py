@@ -9,7 +9,12 @@ class OutlineMode(str, Enum):
     LOCAL = "local"
 
 
-@dataclass
+class TagMatch(str, Enum):
+    ANY = "any"
+    ALL = "all"
+
+
+@dataclass(slots=True)
 class Budget:
     max_input_tokens_approx: int
     max_output_tokens: int
@@ -17,14 +22,14 @@ class Budget:
     estimated_input_tokens: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class FactRef:
     fact_id: str
     reason: str
     weight: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ContextLayer:
     global_context: str = ""
     outline_excerpt: str = ""
@@ -33,20 +38,20 @@ class ContextLayer:
     constraints: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class RenderedPrompt:
     system: str
     user: str
 
 
-@dataclass
+@dataclass(slots=True)
 class DebugInfo:
     selected_fact_refs: list[FactRef] = field(default_factory=list)
     selection_reason: str = ""
     trims_applied: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ContextPack:
     section_key: str
     layers: ContextLayer
@@ -55,7 +60,7 @@ class ContextPack:
     debug: DebugInfo
 
 
-@dataclass
+@dataclass(slots=True)
 class SectionSpec:
     key: str
     fact_tags: list[str] = field(default_factory=list)
@@ -65,3 +70,4 @@ class SectionSpec:
     style_profile: str = "academic"
     target_chars: tuple[int, int] = (3000, 6000)
     constraints: list[str] = field(default_factory=list)
+    tag_match: TagMatch = TagMatch.ANY
@@ -1,5 +1,7 @@
+import sys
+from dataclasses import dataclass, field
 from typing import Any
-from .schema import SectionSpec, FactRef
+from .schema import SectionSpec, FactRef, TagMatch
 
 
 def _evidence_to_strings(evidence: list[Any]) -> list[str]:
@@ -176,35 +178,73 @@ TAG_WEIGHTS = {
 }
 
 
-def _score_fact(fact: dict[str, Any], spec: SectionSpec) -> tuple[float, list[str]]:
-    score = 0.0
-    reasons = []
+@dataclass
+class FactsIndex:
+    facts: list[dict[str, Any]]
+    by_tag: dict[str, list[int]] = field(default_factory=dict)
+    by_key_path: dict[str, list[int]] = field(default_factory=dict)
+    short: list[int] = field(default_factory=list)
+    tag_bits: dict[str, int] = field(default_factory=dict)
+    masks: list[int] = field(default_factory=list)
 
-    fact_tags = fact.get("tags", [])
-    fact_key = fact.get("key_path", "")
+    def with_all_tags(self, tags: list[str]) -> list[int]:
+        if not tags:
+            return []
 
-    if fact_key in spec.fact_keys:
-        score += 3.0
-        reasons.append(f"key:{fact_key}(+3.0)")
+        required = 0
+        for tag in tags:
+            bit = self.tag_bits.get(tag)
+            if bit is None:
+                return []
+            required |= bit
 
-    for tag in spec.fact_tags:
-        if tag in fact_tags:
-            tag_weight = TAG_WEIGHTS.get(tag, 1.0)
-            score += tag_weight
-            reasons.append(f"tag:{tag}(+{tag_weight})")
+        return [i for i, mask in enumerate(self.masks) if mask & required == required]
 
+
+def _length_adjustment(fact: dict[str, Any]) -> tuple[float, str] | None:
     text = fact.get("text", "")
     if len(text) < 100:
-        score += 0.3
-        reasons.append("short(+0.3)")
-    elif len(text) > 500:
-        score -= 0.2
-        reasons.append("long(-0.2)")
+        return 0.3, "short(+0.3)"
+    if len(text) > 500:
+        return -0.2, "long(-0.2)"
+    return None
+
+
+def index_facts(facts: dict[str, Any]) -> FactsIndex:
+    index = FactsIndex(facts=[])
+
+    for fact in collect_facts(facts):
+        if not isinstance(fact, dict):
+            continue
+        if not fact.get("id", ""):
+            continue
+
+        i = len(index.facts)
+        index.facts.append(fact)
+
+        mask = 0
+        for tag in dict.fromkeys(fact.get("tags", [])):
+            if isinstance(tag, str):
+                tag = sys.intern(tag)
+            index.by_tag.setdefault(tag, []).append(i)
+            mask |= index.tag_bits.setdefault(tag, 1 << len(index.tag_bits))
+        index.masks.append(mask)
+        index.by_key_path.setdefault(fact.get("key_path", ""), []).append(i)
+
+        if len(fact.get("text", "")) < 100:
+            index.short.append(i)
 
-    if not reasons:
-        return 0.0, []
+    return index
 
-    return score, reasons
+
+def collect_facts(facts: dict[str, Any]) -> list[dict[str, Any]]:
+    if not isinstance(facts, dict):
+        return []
+
+    if "facts" in facts and isinstance(facts["facts"], list):
+        return facts["facts"]
+
+    return _extract_facts_from_analyzer(facts)
 
 
 def select_facts(
@@ -212,25 +252,44 @@ def select_facts(
     facts: dict[str, Any],
     max_facts: int = 30
 ) -> tuple[list[dict[str, Any]], list[FactRef]]:
-    if not isinstance(facts, dict):
-        return [], []
+    return rank_facts(spec, index_facts(facts), max_facts=max_facts)
 
-    if "facts" in facts and isinstance(facts["facts"], list):
-        facts_list = facts["facts"]
+
+def rank_facts(
+    spec: SectionSpec,
+    index: FactsIndex,
+    max_facts: int = 30
+) -> tuple[list[dict[str, Any]], list[FactRef]]:
+    matches: dict[int, tuple[float, list[str]]] = {}
+
+    for key in dict.fromkeys(spec.fact_keys):
+        for i in index.by_key_path.get(key, ()):
+            matches[i] = (3.0, [f"key:{key}(+3.0)"])
+
+    for tag in spec.fact_tags:
+        tag_weight = TAG_WEIGHTS.get(tag, 1.0)
+        for i in index.by_tag.get(tag, ()):
+            score, reasons = matches.get(i, (0.0, []))
+            reasons.append(f"tag:{tag}(+{tag_weight})")
+            matches[i] = (score + tag_weight, reasons)
+
+    if spec.tag_match == TagMatch.ALL:
+        keyed = {i for key in spec.fact_keys for i in index.by_key_path.get(key, ())}
+        candidates = keyed.union(index.with_all_tags(spec.fact_tags))
     else:
-        facts_list = _extract_facts_from_analyzer(facts)
+        candidates = matches.keys() | set(index.short)
 
     scored_facts = []
 
-    for fact in facts_list:
-        if not isinstance(fact, dict):
-            continue
+    for i in sorted(candidates):
+        fact = index.facts[i]
+        score, reasons = matches.get(i, (0.0, []))
 
-        fact_id = fact.get("id", "")
-        if not fact_id:
-            continue
+        adjustment = _length_adjustment(fact)
+        if adjustment is not None:
+            score += adjustment[0]
+            reasons.append(adjustment[1])
 
-        score, reasons = _score_fact(fact, spec)
         if score > 0:
             scored_facts.append((score, reasons, fact))
 
@@ -1,8 +1,8 @@
 from typing import Any
-from .schema import ContextPack, DebugInfo, Budget
+from .schema import ContextPack, DebugInfo, Budget, SectionSpec
 from .registry import get_section_spec
-from .selectors import select_facts
-from .assembler import assemble_context, render_prompt
+from .selectors import FactsIndex, index_facts, rank_facts
+from .assembler import OutlineIndex, assemble_context, render_prompt
 from .budget import DEFAULT_BUDGET, trim_context
 
 
@@ -14,19 +14,54 @@ def slice_for_section(
     global_context: str = "",
     max_facts: int = 30
 ) -> ContextPack:
+    return slice_for_sections(
+        [section_key],
+        facts,
+        outline,
+        summaries=summaries,
+        global_context=global_context,
+        max_facts=max_facts
+    )[0]
+
+
+def slice_for_sections(
+    section_keys: list[str],
+    facts: dict[str, Any],
+    outline: dict[str, Any],
+    summaries: list[dict[str, Any]] = None,
+    global_context: str = "",
+    max_facts: int = 30
+) -> list[ContextPack]:
     if summaries is None:
         summaries = []
 
-    spec = get_section_spec(section_key)
+    specs = [get_section_spec(key) for key in section_keys]
+    index = index_facts(facts)
+    outline_index = OutlineIndex(outline)
+
+    return [
+        _slice(spec, index, outline_index, summaries, global_context, max_facts)
+        for spec in specs
+    ]
 
-    selected_facts, fact_refs = select_facts(spec, facts, max_facts=max_facts)
+
+def _slice(
+    spec: SectionSpec,
+    index: FactsIndex,
+    outline_index: OutlineIndex,
+    summaries: list[dict[str, Any]],
+    global_context: str,
+    max_facts: int
+) -> ContextPack:
+    selected_facts, fact_refs = rank_facts(spec, index, max_facts=max_facts)
 
     layers = assemble_context(
         spec=spec,
         selected_facts=selected_facts,
-        outline=outline,
+        outline=outline_index.outline,
         summaries=summaries if spec.needs_summaries else [],
-        global_context=global_context
+        global_context=global_context,
+        outline_index=outline_index
     )
 
     trimmed_layers, trims_applied, estimated_tokens = trim_context(
@@ -51,7 +86,7 @@ def slice_for_section(
     )
 
     return ContextPack(
-        section_key=section_key,
+        section_key=spec.key,
         layers=trimmed_layers,
         rendered_prompt=rendered,
         budget=final_budget,
@@ -3,11 +3,13 @@ import re
 from typing import Any
 
 
+_CYRILLIC_RE = re.compile(r'[\u0400-\u04FF]')
+
+
 def _count_cyrillic_ratio(text: str) -> float:
     if not text:
         return 0.0
-    cyrillic_pattern = re.compile(r'[\u0400-\u04FF]')
-    cyrillic_count = len(cyrillic_pattern.findall(text))
+    cyrillic_count = len(_CYRILLIC_RE.findall(text))
     return cyrillic_count / len(text)
 
 
@@ -0,0 +1,92 @@
+from services.analyzer.detectors import detect_architecture_type, detect_frameworks, detect_languages
+from services.analyzer.constants import MAX_SOURCE_CHARS
+from services.analyzer.index import RepoIndex
+
+
+def _framework_names(repo_path):
+    return [fw.name for fw in detect_frameworks(repo_path)]
+
+
+class TestDetectFrameworksPyproject:
+    def test_reads_declared_dependencies(self, tmp_path):
+        (tmp_path / "pyproject.toml").write_text(
+            '[project]\n'
+            'name = "demo"\n'
+            'dependencies = ["fastapi>=0.110", "uvicorn[standard]; python_version >= \'3.10\'"]\n'
+            '\n'
+            '[project.optional-dependencies]\n'
+            'db = ["SQLAlchemy>=2"]\n'
+            '\n'
+            '[tool.pytest.ini_options]\n'
+            'addopts = "-q"\n'
+            '# migrated from django\n'
+        )
+
+        assert _framework_names(tmp_path) == ["FastAPI", "SQLAlchemy", "Uvicorn"]
+
+    def test_reads_poetry_tables(self, tmp_path):
+        (tmp_path / "pyproject.toml").write_text(
+            '[tool.poetry.dependencies]\n'
+            'python = "^3.11"\n'
+            'Django = "^5.0"\n'
+            '\n'
+            '[tool.poetry.group.dev.dependencies]\n'
+            'pytest = { version = "^8.0" }\n'
+        )
+
+        assert _framework_names(tmp_path) == ["Django", "pytest"]
+
+    def test_invalid_toml_falls_back_to_text_scan(self, tmp_path):
+        (tmp_path / "pyproject.toml").write_text('[project\ndependencies = ["flask"]\n')
+
+        assert _framework_names(tmp_path) == ["Flask"]
+
+
+class TestDetectArchitectureLibrary:
+    def test_package_without_web_framework(self, tmp_path):
+        (tmp_path / "pyproject.toml").write_text(
+            '[project]\n'
+            'name = "demo"\n'
+            'description = "Helpers ported from a Django project"\n'
+            'dependencies = ["attrs"]\n'
+        )
+
+        assert detect_architecture_type(tmp_path)["type"] == "library"
+
+    def test_tool_config_only_is_not_a_package(self, tmp_path):
+        (tmp_path / "pyproject.toml").write_text('[tool.black]\nline-length = 100\n')
+
+        assert detect_architecture_type(tmp_path)["type"] == "monolith"
+
+
+class TestDetectFrameworksPackageJson:
+    def test_matches_framework_names_inside_package_names(self, tmp_path):
+        (tmp_path / "package.json").write_text(
+            '{"dependencies": {"left-pad": "1.3.0", "@vue/router": "^4.0.0"},'
+            ' "devDependencies": {"react-dom": "^18.2.0", "lodash": "^4.17.21"}}'
+        )
+
+        assert _framework_names(tmp_path) == ["Vue.js", "React"]
+
+
+class TestDetectLanguages:
+    def test_caches_only_extractor_sources(self, tmp_path):
+        (tmp_path / "main.py").write_text("import os\nprint(os.name)\n")
+        (tmp_path / "main.go").write_text("package main\n")
+        index = RepoIndex.build(tmp_path)
+
+        languages = detect_languages(tmp_path, index)
+
+        assert {lang.name: lang.lines_of_code for lang in languages} == {"Python": 2, "Go": 1}
+        assert list(index._contents) == [str(tmp_path / "main.py")]
+
+    def test_counts_full_file_beyond_source_cap(self, tmp_path):
+        line_count = MAX_SOURCE_CHARS // 6 + 1000
+        (tmp_path / "big.py").write_text("x = 1\n" * line_count)
+        (tmp_path / "big.go").write_text("x := 1\n" * line_count)
+        index = RepoIndex.build(tmp_path)
+
+        languages = detect_languages(tmp_path, index)
+
+        assert {lang.name: lang.lines_of_code for lang in languages} == {"Python": line_count, "Go": line_count}
+        assert len(index.read(tmp_path / "big.py")) == MAX_SOURCE_CHARS
@@ -0,0 +1,104 @@
+import subprocess
+
+from services.analyzer.analyzer import RepoAnalyzer
+from services.analyzer.git import clone_repository, list_head_files, read_head_sha
+
+SHA = "018e2ef47c6dbafe8cc2904f8b75caa6a8180a1d"
+
+
+def _git_dir(tmp_path, head):
+    git_dir = tmp_path / ".git"
+    git_dir.mkdir()
+    (git_dir / "HEAD").write_text(head)
+    return git_dir
+
+
+class TestReadHeadSha:
+    def test_loose_ref(self, tmp_path):
+        git_dir = _git_dir(tmp_path, "ref: refs/heads/main\n")
+        (git_dir / "refs" / "heads").mkdir(parents=True)
+        (git_dir / "refs" / "heads" / "main").write_text(SHA + "\n")
+
+        assert read_head_sha(tmp_path) == SHA
+
+    def test_packed_ref(self, tmp_path):
+        git_dir = _git_dir(tmp_path, "ref: refs/heads/main\n")
+        (git_dir / "packed-refs").write_text(
+            "# pack-refs with: peeled fully-peeled sorted \n"
+            f"{SHA} refs/heads/main\n"
+        )
+
+        assert read_head_sha(tmp_path) == SHA
+
+    def test_detached_head(self, tmp_path):
+        _git_dir(tmp_path, SHA + "\n")
+
+        assert read_head_sha(tmp_path) == SHA
+
+    def test_unresolved(self, tmp_path):
+        assert read_head_sha(tmp_path) is None
+        _git_dir(tmp_path, "ref: refs/heads/main\n")
+        assert read_head_sha(tmp_path) is None
+
+
+def _commit_repo(repo_path, files):
+    for rel, content in files.items():
+        path = repo_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    git = ["git", "-c", "user.name=test", "-c", "user.email=test@example.com"]
+    subprocess.run(git + ["init", "-q"], cwd=repo_path, check=True)
+    subprocess.run(git + ["add", *files], cwd=repo_path, check=True)
+    subprocess.run(git + ["commit", "-q", "-m", "init"], cwd=repo_path, check=True)
+
+
+class TestListHeadFiles:
+    def test_lists_committed_blobs(self, tmp_path):
+        (tmp_path / "untracked.py").write_text("x")
+        _commit_repo(tmp_path, {"app/main.py": "x", "README.md": "x"})
+
+        assert list_head_files(tmp_path) == ["README.md", "app/main.py"]
+
+    def test_not_a_repository(self, tmp_path):
+        assert list_head_files(tmp_path) is None
+
+
+class TestSparseClone:
+    def test_generate_facts_with_skipped_only_dirs(self, tmp_path):
+        source = tmp_path / "src_repo"
+        source.mkdir()
+        _commit_repo(source, {
+            "backend/main.py": "from fastapi import FastAPI\napp = FastAPI()\n",
+            "backend/api/build/schema.json": "{}\n",
+            "client/dist/bundle.js": "console.log(1)\n",
+        })
+        analyzer = RepoAnalyzer(f"file://{source}", work_dir=str(tmp_path / "work"))
+
+        repo_path = analyzer.clone()
+        facts = analyzer.generate_facts()
+
+        assert (repo_path / "backend" / "main.py").is_file()
+        assert not (repo_path / "client" / "dist").exists()
+        assert facts["repo"]["commit"] == analyzer.commit_sha
+        assert facts["architecture"]["type"] == "client-server"
+        assert facts["architecture"]["layers"] == ["backend", "frontend"]
+        assert [module["path"] for module in facts["modules"]] == ["backend/api"]
+
+    def test_falls_back_to_full_checkout(self, tmp_path, monkeypatch):
+        source = tmp_path / "src_repo"
+        source.mkdir()
+        _commit_repo(source, {"backend/main.py": "x\n", "client/dist/bundle.js": "x\n"})
+        run = subprocess.run
+
+        def fail_sparse_checkout(args, **kwargs):
+            if args[:2] == ["git", "sparse-checkout"]:
+                return subprocess.CompletedProcess(args, 129, "", "error: unknown option `no-cone'")
+            return run(args, **kwargs)
+
+        monkeypatch.setattr(subprocess, "run", fail_sparse_checkout)
+
+        repo_path, commit_sha = clone_repository(f"file://{source}", str(tmp_path / "work"))
+
+        assert commit_sha == read_head_sha(repo_path)
+        assert (repo_path / "backend" / "main.py").is_file()
+        assert (repo_path / "client" / "dist" / "bundle.js").is_file()
@@ -0,0 +1,62 @@
+from pathlib import Path
+
+from services.analyzer.index import RepoIndex
+from services.analyzer.utils import iter_files
+
+
+def _make_tree(root, paths):
+    for rel in paths:
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x")
+
+
+class TestRepoIndex:
+    def test_find_matches_walk_order(self, tmp_path):
+        _make_tree(tmp_path, [
+            "main.py",
+            "backend/app.py",
+            "backend/api/main.py",
+            "node_modules/pkg/main.py",
+        ])
+        index = RepoIndex.build(tmp_path)
+
+        assert index.find("main.py") == [
+            Path(entry.path) for entry in iter_files(tmp_path) if entry.name == "main.py"
+        ]
+        assert index.find("main.py", "app.py") == [
+            p for p in (Path(path) for path, _ in index.files) if p.name in ("main.py", "app.py")
+        ]
+        assert index.find("missing.py") == []
+
+    def test_with_suffix(self, tmp_path):
+        _make_tree(tmp_path, ["a.py", "b.ts", "web/c.tsx", "d.txt"])
+        index = RepoIndex.build(tmp_path)
+
+        assert sorted(p.name for p in index.with_suffix(".ts", ".tsx")) == ["b.ts", "c.tsx"]
+        assert [p.name for p in index.with_suffix(".py")] == ["a.py"]
+
+    def test_from_paths(self, tmp_path):
+        index = RepoIndex.from_paths(tmp_path, [
+            "README.md",
+            "backend/app/main.py",
+            "node_modules/react/index.js",
+            "web/node_modules/vue/index.js",
+            "web/src/main.ts",
+        ])
+
+        assert index.top_level_dirs == ["backend", "node_modules", "web"]
+        assert index.subdirs("web") == ["node_modules", "src"]
+        assert index.subdirs("backend/app") == []
+        assert index.find("main.py") == [tmp_path / "backend" / "app" / "main.py"]
+        assert [p.name for p in index.with_suffix(".js", ".ts")] == ["main.ts"]
+
+    def test_read_caches_contents(self, tmp_path):
+        _make_tree(tmp_path, ["app/main.py"])
+        index = RepoIndex.build(tmp_path)
+        path = index.find("main.py")[0]
+
+        assert index.read(path) == "x"
+        path.write_text("changed")
+        assert index.read(str(path)) == "x"
+        assert index.read(tmp_path / "missing.py") is None
@@ -4,6 +4,7 @@ from rest_framework.test import APIClient
 from apps.projects.models import Project, AnalysisRun, Artifact
 from apps.projects.views import _make_analysis_fingerprint
 from services.analyzer.constants import ANALYZER_VERSION
+from services.prompting import SectionSpec
 
 
 @pytest.fixture
@@ -11,7 +12,6 @@ def api_client():
     return APIClient()
 
 
-@pytest.mark.django_db
 class TestFingerprint:
     def test_same_inputs_same_fingerprint(self):
         fp1 = _make_analysis_fingerprint('https://github.com/test/repo', 'main', {'branch': 'main'})
@@ -116,12 +116,9 @@ class TestArtifactsCreated:
         run.refresh_from_db()
         assert run.status == AnalysisRun.Status.SUCCESS
 
-        artifacts = Artifact.objects.filter(analysis_run=run)
-        kinds = set(a.kind for a in artifacts)
-
-        assert Artifact.Kind.FACTS in kinds
-        assert Artifact.Kind.META in kinds
-        assert Artifact.Kind.TRACE in kinds
+        kinds = set(Artifact.objects.filter(analysis_run=run).values_list('kind', flat=True))
+        missing = {Artifact.Kind.FACTS, Artifact.Kind.META, Artifact.Kind.TRACE} - kinds
+        assert not missing, f"Missing artifacts: {missing}"
 
     def test_meta_artifact_has_info(self, db, mocker):
         from tasks.analyzer_tasks import run_analysis
@@ -171,3 +168,17 @@ class TestRunStepEndpoint:
         response = api_client.post(f'/api/v1/jobs/{run.id}/run/?step=extract')
         assert response.status_code == 202
         assert response.data['step'] == 'extract'
+
+
+class TestSectionsRegistry:
+    def test_plain_string_tag_match(self, api_client, mocker):
+        mocker.patch('apps.projects.views.list_section_keys', return_value=['custom'])
+        mocker.patch(
+            'apps.projects.views.get_section_spec',
+            return_value=SectionSpec(key='custom', fact_tags=['api'], tag_match='all')
+        )
+
+        response = api_client.get('/api/v1/sections/')
+
+        assert response.status_code == 200
+        assert response.data[0]['tag_match'] == 'all'
@@ -0,0 +1,27 @@
+from services.analyzer.parsers import parse_requirements_txt
+
+
+class TestParseRequirementsTxt:
+    def test_parses_names_and_versions(self, tmp_path):
+        path = tmp_path / "requirements.txt"
+        path.write_bytes(
+            b"# core\r\n"
+            b"Django>=5.0\r\n"
+            b"  uvicorn[standard] >= 0.29  \r\n"
+            b"-r base.txt\r\n"
+            b"-e git+https://example.com/pkg.git\r\n"
+            b"\r\n"
+            b"celery\r\n"
+        )
+
+        deps = parse_requirements_txt(path, "requirements.txt")
+
+        assert [(d.name, d.version) for d in deps] == [
+            ("django", ">=5.0"),
+            ("uvicorn", ">= 0.29"),
+            ("celery", "*"),
+        ]
+        assert all(d.evidence[0].path == "requirements.txt" for d in deps)
+
+    def test_missing_file(self, tmp_path):
+        assert parse_requirements_txt(tmp_path / "missing.txt", "missing.txt") == []
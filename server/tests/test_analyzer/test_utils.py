@@ -0,0 +1,65 @@
+import os
+
+import pytest
+
+from services.analyzer.constants import SKIP_DIRS
+from services.analyzer.utils import file_ext, iter_files, read_source
+
+
+def _walk_files(root):
+    found = []
+    for dirpath, dirs, files in os.walk(root):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+        found.extend(os.path.join(dirpath, f) for f in files)
+    return found
+
+
+class TestIterFiles:
+    def test_matches_os_walk(self, tmp_path):
+        for rel in [
+            "main.py",
+            "app/models.py",
+            "app/api/routes.py",
+            "app/api/deps/auth.py",
+            "web/src/App.tsx",
+            "node_modules/react/index.js",
+            "app/__pycache__/models.cpython-311.pyc",
+        ]:
+            path = tmp_path / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("x")
+        os.symlink(tmp_path / "app", tmp_path / "app_link")
+
+        assert [entry.path for entry in iter_files(tmp_path)] == _walk_files(tmp_path)
+
+    def test_empty_path(self):
+        assert list(iter_files(None)) == []
+
+
+@pytest.mark.parametrize("name,expected", [
+    ("main.py", ".py"),
+    ("App.TSX", ".tsx"),
+    ("archive.tar.gz", ".gz"),
+    (".bashrc", ""),
+    ("Makefile", ""),
+    ("trailing.", ""),
+])
+def test_file_ext(name, expected):
+    assert file_ext(name) == expected
+
+
+class TestReadSource:
+    def test_truncates_to_limit(self, tmp_path):
+        path = tmp_path / "bundle.js"
+        path.write_text("x" * 100)
+
+        assert read_source(path, limit=10) == "x" * 10
+
+    def test_skips_binary(self, tmp_path):
+        path = tmp_path / "data.py"
+        path.write_bytes(b"\x00\x01\x02route")
+
+        assert read_source(path) is None
+
+    def test_missing_file(self, tmp_path):
+        assert read_source(tmp_path / "missing.py") is None
@@ -6,6 +6,9 @@ from rest_framework.test import APIClient
 from apps.projects.models import Document, Section, AnalysisRun, Artifact, Project
 
 
+MISSING_ID = uuid.UUID('00000000-0000-4000-8000-000000000001')
+
+
 @pytest.fixture
 def api_client():
     return APIClient()
@@ -61,7 +64,7 @@ class TestDocumentAPI:
 
     def test_create_document_not_found(self, api_client):
         response = api_client.post('/api/v1/documents/', {
-            'analysis_run_id': str(uuid.uuid4()),
+            'analysis_run_id': str(MISSING_ID),
         }, format='json')
         assert response.status_code == 404
 
@@ -71,7 +74,7 @@ class TestDocumentAPI:
         assert response.data['id'] == str(document.id)
 
     def test_get_document_not_found(self, api_client):
-        response = api_client.get(f'/api/v1/documents/{uuid.uuid4()}/')
+        response = api_client.get(f'/api/v1/documents/{MISSING_ID}/')
         assert response.status_code == 404
 
     def test_get_outline_empty(self, api_client, document):
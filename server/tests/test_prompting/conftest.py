@@ -0,0 +1,55 @@
+import json
+from pathlib import Path
+
+import pytest
+
+FIXTURES_DIR = Path(__file__).resolve().parent.parent / "fixtures"
+
+
+# Session-scoped: every test shares these payloads and must treat them as read-only.
+
+
+@pytest.fixture(scope="session")
+def sample_facts():
+    return {
+        "facts": [
+            {
+                "id": "fact_1",
+                "tags": ["project_name", "description"],
+                "key_path": "project.name",
+                "text": "Project Name: Test App",
+                "details": "A test application for demonstration"
+            },
+            {
+                "id": "fact_2",
+                "tags": ["tech_stack"],
+                "key_path": "tech.stack",
+                "text": "Tech Stack: Python, Django",
+                "details": "Backend built with Django 5.0"
+            },
+            {
+                "id": "fact_3",
+                "tags": ["architecture"],
+                "key_path": "arch.pattern",
+                "text": "Architecture: Layered",
+                "details": "Three-tier architecture"
+            }
+        ]
+    }
+
+
+@pytest.fixture(scope="session")
+def analyzer_facts():
+    return json.loads((FIXTURES_DIR / "analyzer_facts.json").read_bytes())
+
+
+@pytest.fixture(scope="session")
+def sample_outline():
+    return {
+        "title": "Test Document",
+        "sections": [
+            {"key": "intro", "title": "Introduction", "order": 0},
+            {"key": "architecture", "title": "Architecture", "order": 1},
+            {"key": "api", "title": "API", "order": 2}
+        ]
+    }
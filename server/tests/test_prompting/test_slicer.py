@@ -1,94 +1,20 @@
-import pytest
-from services.prompting import slice_for_section, get_section_spec
-
-
-@pytest.fixture
-def sample_facts():
-    return {
-        "facts": [
-            {
-                "id": "fact_1",
-                "tags": ["project_name", "description"],
-                "key_path": "project.name",
-                "text": "Project Name: Test App",
-                "details": "A test application for demonstration"
-            },
-            {
-                "id": "fact_2",
-                "tags": ["tech_stack"],
-                "key_path": "tech.stack",
-                "text": "Tech Stack: Python, Django",
-                "details": "Backend built with Django 5.0"
-            },
-            {
-                "id": "fact_3",
-                "tags": ["architecture"],
-                "key_path": "arch.pattern",
-                "text": "Architecture: Layered",
-                "details": "Three-tier architecture"
-            }
-        ]
-    }
+from dataclasses import fields
 
-
-@pytest.fixture
-def analyzer_facts():
-    return {
-        "schema": "facts/v1",
-        "repo": {
-            "url": "https://github.com/test/repo",
-            "commit": "abc123",
-            "detected_at": "2025-01-01T00:00:00Z"
-        },
-        "languages": [
-            {"name": "Python", "ratio": 0.7, "lines_of_code": 5000, "evidence": []},
-            {"name": "JavaScript", "ratio": 0.3, "lines_of_code": 2000, "evidence": []}
-        ],
-        "frameworks": [
-            {"name": "Django", "type": "backend", "evidence": []},
-            {"name": "React", "type": "frontend", "evidence": []}
-        ],
-        "architecture": {
-            "type": "layered",
-            "confidence": 0.85,
-            "evidence": ["apps/", "services/", "api/"]
-        },
-        "modules": [
-            {"name": "apps", "role": "applications", "path": "apps/", "submodules": ["core", "auth"], "evidence": []},
-            {"name": "services", "role": "business_logic", "path": "services/", "submodules": ["llm"], "evidence": []}
-        ],
-        "api": {
-            "endpoints": [
-                {"method": "GET", "path": "/users", "full_path": "/api/v1/users", "handler": "list_users", "router": "api", "file": "views.py", "tags": [], "auth_required": True, "description": "List users"},
-                {"method": "POST", "path": "/auth/login", "full_path": "/api/v1/auth/login", "handler": "login", "router": "auth", "file": "auth.py", "tags": [], "auth_required": False, "description": "Login"}
-            ],
-            "total_count": 2
-        },
-        "frontend_routes": [],
-        "models": [
-            {"name": "User", "table": "users", "fields": ["id", "email", "name"], "relationships": [], "file": "models.py"}
-        ],
-        "runtime": {
-            "dependencies": [
-                {"name": "django", "version": "5.0", "evidence": []},
-                {"name": "djangorestframework", "version": "3.14", "evidence": []}
-            ],
-            "build_files": ["Dockerfile", "docker-compose.yml"],
-            "entrypoints": ["manage.py"]
-        }
-    }
+import pytest
+from services.prompting import (
+    SectionSpec,
+    TagMatch,
+    get_section_spec,
+    slice_for_section,
+    slice_for_sections,
+)
+from services.prompting.assembler import OutlineIndex
+from services.prompting.schema import OutlineMode
+from services.prompting.selectors import select_facts
 
 
-@pytest.fixture
-def sample_outline():
-    return {
-        "title": "Test Document",
-        "sections": [
-            {"key": "intro", "title": "Introduction", "order": 0},
-            {"key": "architecture", "title": "Architecture", "order": 1},
-            {"key": "api", "title": "API", "order": 2}
-        ]
-    }
+def _field_names(obj) -> set[str]:
+    return {f.name for f in fields(obj)}
 
 
 def test_slice_for_section_intro(sample_facts, sample_outline):
@@ -164,78 +90,113 @@ def test_context_pack_structure(sample_facts, sample_outline):
         global_context="Test"
     )
 
-    assert hasattr(context_pack, 'section_key')
-    assert hasattr(context_pack, 'layers')
-    assert hasattr(context_pack, 'rendered_prompt')
-    assert hasattr(context_pack, 'budget')
-    assert hasattr(context_pack, 'debug')
-
-    assert hasattr(context_pack.layers, 'global_context')
-    assert hasattr(context_pack.layers, 'outline_excerpt')
-    assert hasattr(context_pack.layers, 'facts_slice')
-    assert hasattr(context_pack.layers, 'summaries')
-    assert hasattr(context_pack.layers, 'constraints')
-
-    assert hasattr(context_pack.rendered_prompt, 'system')
-    assert hasattr(context_pack.rendered_prompt, 'user')
+    assert {"section_key", "layers", "rendered_prompt", "budget", "debug"} <= _field_names(context_pack)
+    assert {
+        "global_context", "outline_excerpt", "facts_slice", "summaries", "constraints"
+    } <= _field_names(context_pack.layers)
+    assert {"system", "user"} <= _field_names(context_pack.rendered_prompt)
+    assert {"selected_fact_refs", "selection_reason", "trims_applied"} <= _field_names(context_pack.debug)
 
-    assert hasattr(context_pack.debug, 'selected_fact_refs')
-    assert hasattr(context_pack.debug, 'selection_reason')
-    assert hasattr(context_pack.debug, 'trims_applied')
 
-
-def test_slice_analyzer_facts_intro(analyzer_facts, sample_outline):
+@pytest.mark.parametrize("section_key,expected_tags", [
+    ("intro", ("tech_stack",)),
+    ("architecture", ("architecture", "modules")),
+    ("api", ("api", "endpoints")),
+])
+def test_slice_analyzer_facts(analyzer_facts, sample_outline, section_key, expected_tags):
     context_pack = slice_for_section(
-        section_key="intro",
+        section_key=section_key,
         facts=analyzer_facts,
         outline=sample_outline,
         summaries=[],
         global_context="Test project"
     )
 
-    assert context_pack.section_key == "intro"
+    assert context_pack.section_key == section_key
     assert len(context_pack.debug.selected_fact_refs) > 0
 
-    has_tech_stack = any(
-        "tech_stack" in ref.reason
+    has_expected_tag = any(
+        tag in ref.reason
         for ref in context_pack.debug.selected_fact_refs
+        for tag in expected_tags
     )
-    assert has_tech_stack
+    assert has_expected_tag
 
 
-def test_slice_analyzer_facts_architecture(analyzer_facts, sample_outline):
-    context_pack = slice_for_section(
-        section_key="architecture",
-        facts=analyzer_facts,
-        outline=sample_outline,
-        summaries=[],
-        global_context="Test project"
-    )
+def test_slice_for_sections_matches_single_calls(analyzer_facts, sample_outline):
+    keys = ["intro", "architecture", "api"]
 
-    assert context_pack.section_key == "architecture"
-    assert len(context_pack.debug.selected_fact_refs) > 0
+    packs = slice_for_sections(keys, analyzer_facts, sample_outline)
 
-    has_architecture = any(
-        "architecture" in ref.reason or "modules" in ref.reason
-        for ref in context_pack.debug.selected_fact_refs
-    )
-    assert has_architecture
+    assert [pack.section_key for pack in packs] == keys
+    for key, pack in zip(keys, packs):
+        assert pack == slice_for_section(key, analyzer_facts, sample_outline)
 
 
-def test_slice_analyzer_facts_api(analyzer_facts, sample_outline):
-    context_pack = slice_for_section(
-        section_key="api",
-        facts=analyzer_facts,
-        outline=sample_outline,
-        summaries=[],
-        global_context="Test project"
-    )
+def test_slice_for_sections_unknown_key(sample_facts, sample_outline):
+    with pytest.raises(ValueError):
+        slice_for_sections(["intro", "missing"], sample_facts, sample_outline)
 
-    assert context_pack.section_key == "api"
-    assert len(context_pack.debug.selected_fact_refs) > 0
 
-    has_api = any(
-        "api" in ref.reason or "endpoints" in ref.reason
-        for ref in context_pack.debug.selected_fact_refs
+TAGGED_FACTS = {
+    "facts": [
+        {"id": "layers_only", "tags": ["layers"], "key_path": "a", "text": "Layers"},
+        {"id": "both", "tags": ["architecture", "layers"], "key_path": "b", "text": "Both"},
+        {"id": "arch_only", "tags": ["architecture"], "key_path": "c", "text": "Arch"},
+        {"id": "untagged", "tags": [], "key_path": "d", "text": "Plain"},
+    ]
+}
+
+
+@pytest.mark.parametrize("tag_match,expected_ids", [
+    (TagMatch.ANY, ["both", "arch_only", "layers_only", "untagged"]),
+    (TagMatch.ALL, ["both"]),
+])
+def test_select_facts_tag_match(tag_match, expected_ids):
+    spec = SectionSpec(
+        key="custom",
+        fact_tags=["architecture", "layers"],
+        tag_match=tag_match,
     )
-    assert has_api
+
+    selected, refs = select_facts(spec, TAGGED_FACTS)
+
+    assert [fact["id"] for fact in selected] == expected_ids
+    assert [ref.fact_id for ref in refs] == expected_ids
+
+
+def test_select_facts_all_without_tags_uses_keys_only():
+    spec = SectionSpec(key="custom", fact_keys=["b"], tag_match=TagMatch.ALL)
+
+    selected, refs = select_facts(spec, TAGGED_FACTS)
+
+    assert [fact["id"] for fact in selected] == ["both"]
+    assert [ref.fact_id for ref in refs] == ["both"]
+
+
+def test_outline_index_local_excerpt():
+    outline = {
+        "title": "Doc",
+        "sections": [
+            {"key": "intro", "title": "Intro", "points": ["a"]},
+            {"key": "architecture", "title": "Architecture", "points": ["b"]},
+            {"key": "api", "title": "API", "points": ["c"]},
+            {"key": "conclusion", "title": "Conclusion", "points": ["d"]},
+        ]
+    }
+    index = OutlineIndex(outline)
+
+    excerpt = index.excerpt(OutlineMode.LOCAL, "api")
+
+    assert excerpt.splitlines() == [
+        "Название: Doc",
+        "",
+        "  [architecture] Architecture",
+        "    - b",
+        "> [api] API",
+        "    - c",
+        "  [conclusion] Conclusion",
+        "    - d",
+    ]
+    assert index.excerpt(OutlineMode.LOCAL, "api") is excerpt
+    assert index.excerpt(OutlineMode.LOCAL, "missing") == ""